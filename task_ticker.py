@@ -4,16 +4,24 @@ Author: Neils Haldane-Lutterodt
 '''
 
 import tkinter as tk
-from tkinter import messagebox
-from tkcalendar import DateEntry
+from tkinter import messagebox, ttk
 import json
 import os
 from uuid import uuid4
 from datetime import datetime
-import shutil
+import sqlite3
 import logging
-import traceback
-from typing import Dict, List, Optional, Any
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Any, Set, Tuple, Union, Iterable
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib json module
+    orjson = None
 
 # ---------------------------
 # CONFIGURATION
@@ -21,8 +29,9 @@ from typing import Dict, List, Optional, Any
 class Config:
     """Centralized configuration management"""
     PATHS = {
+        "DATABASE": "tasks.db",
         "TASKS": "tasks.json",
-        "BACKUP": "tasks_backup.json",
+        "BACKUP": "tasks_backup.db",
         "SETTINGS": "settings.json",
         "LOG": "task_ticker.log"
     }
@@ -34,39 +43,104 @@ class Config:
         "window_size": "600x680"
     }
 
+    SORT_KEYS = ("due_date", "created_at", "priority", "sequence")
+
+    # Task list layout; LIST_ROWS is also the number of rows kept in the tree
+    LIST_ROWS = 18
+    LIST_COLUMNS = ("seq", "status", "task", "group", "due")
+    LIST_HEADINGS = ("#", "Done", "Task", "Group", "Due")
+    LIST_WIDTHS = (40, 50, 250, 100, 100)
+
+    # Delay used to coalesce rapid task changes into a single save
+    SAVE_DEBOUNCE_MS = 250
+
     UI_STRINGS = {
         "WINDOW_TITLE": "Task Ticker 📝",
         "ERROR_NO_SELECTION": "Please select a task.",
         "ERROR_EMPTY_INPUT": "Please enter a task.",
         "ERROR_DEPENDENCY_SELF": "A task cannot depend on itself.",
         "ERROR_DEPENDENCY_UNMET": "This task depends on '{}' which is not yet done.",
+        "ERROR_DEPENDENCY_CYCLE": "This dependency would create a circular chain.",
         "ERROR_DUE_DATE": "Dependent task has an earlier due date than its parent.",
         "ERROR_LOAD": "Error loading {}: {}",
+        "ERROR_NO_STORE": "The task database is unavailable, so changes cannot be saved.",
+        "GLYPH_DONE": "✔",
+        "GLYPH_BLOCKED": " ⛔",
     }
 
+# ---------------------------
+# TASK MODEL
+# ---------------------------
+@dataclass(slots=True, eq=False)
+class Task:
+    """A single task; slots keep it compact and make field access cheap"""
+    id: str
+    task: str
+    status: str = "pending"
+    group: str = "General"
+    due_date: Optional[str] = None
+    created_at: Optional[str] = None
+    priority: str = "normal"
+    sequence: Optional[int] = None
+    depends_on: Optional[str] = None
+    # Keys this version does not know about, kept so they round-trip
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Task":
+        """Build a task from stored data, keeping unknown keys in extra"""
+        known = {f.name for f in fields(cls) if f.name != "extra"}
+        task = cls(**{k: v for k, v in data.items() if k in known},
+                   extra={k: v for k, v in data.items() if k not in known})
+        task.status = (task.status or "pending").lower()
+        return task
+
+    def to_dict(self) -> Dict:
+        data = dict(self.extra)
+        data.update((f.name, getattr(self, f.name)) for f in fields(self)
+                    if f.name != "extra")
+        return data
+
 # ---------------------------
 # LOGGING SETUP
 # ---------------------------
 class LoggerSetup:
     """Centralized logging configuration"""
+    listener: Optional[QueueListener] = None
+
     @staticmethod
     def setup_logger():
         logger = logging.getLogger('task_ticker')
         logger.setLevel(logging.INFO)
         
-        # File handler
+        # File handler, driven from a background thread so log writes never
+        # block the Tk event loop
         file_handler = logging.FileHandler(Config.PATHS["LOG"])
         file_handler.setLevel(logging.INFO)
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        LoggerSetup.shutdown()
+        LoggerSetup.listener = QueueListener(log_queue, file_handler,
+                                             respect_handler_level=True)
+        LoggerSetup.listener.start()
         
         # Clear existing handlers
         logger.handlers = []
-        logger.addHandler(file_handler)
+        logger.addHandler(QueueHandler(log_queue))
         
         return logger
 
+    @staticmethod
+    def shutdown() -> None:
+        """Drain queued records to disk and stop the listener thread"""
+        if LoggerSetup.listener is not None:
+            LoggerSetup.listener.stop()
+            LoggerSetup.listener = None
+
 logger = LoggerSetup.setup_logger()
+atexit.register(LoggerSetup.shutdown)
 
 # ---------------------------
 # ERROR HANDLING
@@ -76,7 +150,9 @@ class ErrorHandler:
     @staticmethod
     def handle_error(error: Exception, context: str, show_message: bool = True) -> None:
         error_msg = f"{context}: {str(error)}"
-        logger.error(f"{error_msg}\n{traceback.format_exc()}")
+        # Tracebacks are only formatted (lazily, by logging) when debugging
+        logger.error(error_msg,
+                     exc_info=error if logger.isEnabledFor(logging.DEBUG) else None)
         if show_message:
             messagebox.showerror("Error", error_msg)
 
@@ -86,67 +162,295 @@ class ErrorHandler:
 class FileManager:
     """Handles all file operations"""
     @staticmethod
-    def load_json(filepath: str, default: Any = None) -> Any:
+    def read_json(filepath: str, default: Any = None) -> Any:
+        """Read a JSON file, leaving errors to the caller (safe off the UI thread)"""
         try:
-            if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    return json.load(f)
-            return default
-        except Exception as e:
-            ErrorHandler.handle_error(e, f"Error loading {filepath}")
+            with open(filepath, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
             return default
+        return FileManager.loads(content)
 
     @staticmethod
-    def save_json(filepath: str, data: Any, create_backup: bool = False) -> bool:
-        try:
-            if create_backup and os.path.exists(filepath):
-                shutil.copy(filepath, Config.PATHS["BACKUP"])
-                logger.info(f"Backup created: {Config.PATHS['BACKUP']}")
+    def loads(content: Union[bytes, str]) -> Any:
+        """Parse JSON, using orjson when it is installed"""
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
+    @staticmethod
+    def dumps(data: Any, pretty: bool = False) -> bytes:
+        """Serialize data; compact unless a human-readable export is requested"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=4)
+    @staticmethod
+    def save_json(filepath: str, data: Any, pretty: bool = False) -> bool:
+        return FileManager.write_bytes(filepath, FileManager.dumps(data, pretty))
+
+    @staticmethod
+    def write_bytes(filepath: str, content: bytes) -> bool:
+        """Atomically replace filepath with content via a temp file"""
+        tmp_path = filepath + ".tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
             logger.info(f"Successfully saved to {filepath}")
             return True
         except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             ErrorHandler.handle_error(e, f"Error saving to {filepath}")
             return False
 
+# ---------------------------
+# DATABASE
+# ---------------------------
+class TaskStore:
+    """SQLite-backed task storage that writes only the rows that changed"""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            status TEXT,
+            group_name TEXT,
+            due_date TEXT,
+            sequence INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_filter
+            ON tasks (status, group_name, due_date);
+    """
+    # PRAGMA user_version once the legacy tasks.json has been imported
+    MIGRATED_VERSION = 1
+
+    def __init__(self, filepath: str):
+        # The store may be opened on a startup worker thread and then used
+        # from the Tk thread; access is never concurrent
+        self.conn = sqlite3.connect(filepath, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def is_empty(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is None
+
+    def is_migrated(self) -> bool:
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        return version >= self.MIGRATED_VERSION
+
+    def load_all(self) -> List[Task]:
+        """Load every task in insertion order"""
+        rows = self.conn.execute("SELECT payload FROM tasks ORDER BY rowid")
+        return [Task.from_dict(FileManager.loads(payload)) for (payload,) in rows]
+
+    def write(self, upserts: Iterable[Task], deletes: Iterable[str],
+              mark_migrated: bool = False) -> None:
+        """Apply inserted/updated and deleted tasks in a single transaction"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO tasks (id, payload, status, group_name, due_date, sequence) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET payload=excluded.payload, "
+                "status=excluded.status, group_name=excluded.group_name, "
+                "due_date=excluded.due_date, sequence=excluded.sequence",
+                [(t.id, FileManager.dumps(t.to_dict()).decode("utf-8"), t.status,
+                  t.group, t.due_date, t.sequence) for t in upserts]
+            )
+            self.conn.executemany("DELETE FROM tasks WHERE id = ?",
+                                  [(task_id,) for task_id in deletes])
+            if mark_migrated:
+                self.conn.execute(f"PRAGMA user_version = {self.MIGRATED_VERSION}")
+
+    def backup(self, filepath: str) -> None:
+        """Copy a consistent snapshot of the database to filepath"""
+        target = sqlite3.connect(filepath)
+        try:
+            self.conn.backup(target)
+        finally:
+            target.close()
+        logger.info(f"Backup created: {filepath}")
+
+    def close(self) -> None:
+        self.conn.close()
+
 # ---------------------------
 # TASK MANAGEMENT
 # ---------------------------
 class TaskManager:
     """Handles task operations and data management"""
-    def __init__(self):
-        self.tasks: List[Dict] = []
-        self.visible_tasks: List[Dict] = []
+    def __init__(self, root: Optional[tk.Misc] = None):
+        self.root = root
+        self._save_after_id: Optional[str] = None
+        self.tasks: List[Task] = []
+        self.visible_tasks: List[Task] = []
         self.dependency_map: Dict[str, str] = {}
+        self._by_id: Dict[str, Task] = {}
+        self._by_group: Dict[str, List[Task]] = {}
+        self._by_status: Dict[str, List[Task]] = {}
+        self._sorted_groups_cache: Optional[Tuple[str, ...]] = None
+        self.store: Optional[TaskStore] = None
+        # Task ID -> task to write, or None for a task to delete
+        self._pending: Dict[str, Optional[Task]] = {}
+        # Set by read_tasks, reported by load_tasks on the UI thread
+        self._import_error: Optional[Exception] = None
 
-    def load_tasks(self) -> None:
-        """Load tasks with error handling"""
-        loaded_tasks = FileManager.load_json(Config.PATHS["TASKS"], default=[])
-        if loaded_tasks is not None:
-            self.tasks = loaded_tasks
+    def read_tasks(self) -> List[Task]:
+        """Open the database and read every task, importing tasks.json on first run"""
+        self.store = TaskStore(Config.PATHS["DATABASE"])
+        self._import_error = None
+        if not self.store.is_migrated():
+            try:
+                self.import_tasks(Config.PATHS["TASKS"])
+            except Exception as e:
+                # The marker stays unset so the import is retried next start;
+                # rows already in the database still load
+                self._import_error = e
+        self.backup_tasks()
+        return self.store.load_all()
+
+    def load_tasks(self, pending: Optional[Future] = None) -> None:
+        """Load tasks with error handling, optionally from a read_tasks future"""
+        try:
+            self.tasks = pending.result() if pending is not None else self.read_tasks()
             logger.info("Tasks loaded successfully")
-        else:
+        except Exception as e:
+            ErrorHandler.handle_error(e, "Error loading tasks")
             self.tasks = []
             logger.warning("Starting with empty task list")
+        if self._import_error is not None:
+            ErrorHandler.handle_error(self._import_error,
+                                      f"Error importing {Config.PATHS['TASKS']}")
+            self._import_error = None
+        self._rebuild_index()
+        self._pending.clear()
+
+    def import_tasks(self, filepath: str) -> None:
+        """Copy tasks from a JSON file into the database and record the migration"""
+        imported = FileManager.read_json(filepath, default=[]) or []
+        self.store.write([Task.from_dict(t) for t in imported], (), mark_migrated=True)
+        logger.info(f"Imported {len(imported)} tasks from {filepath}")
+
+    def export_tasks(self, filepath: str) -> bool:
+        """Write all tasks to a human-readable JSON file"""
+        return FileManager.save_json(filepath, [t.to_dict() for t in self.tasks],
+                                     pretty=True)
+
+    def backup_tasks(self) -> None:
+        """Snapshot the database before this session writes to it"""
+        # Keep the previous backup rather than replacing it with an empty one
+        if self.store.is_empty():
+            return
+        try:
+            self.store.backup(Config.PATHS["BACKUP"])
+        except Exception as e:
+            # Runs on a startup worker thread, so only log the failure
+            ErrorHandler.handle_error(e, "Error backing up tasks", show_message=False)
+
+    def close(self) -> None:
+        """Write pending changes and close the database"""
+        self.save_tasks()
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the ID, group and status lookup tables from the task list"""
+        self._by_id = {}
+        self._by_group = {}
+        self._by_status = {}
+        for task in self.tasks:
+            self._index_task(task)
+
+    def _index_task(self, task: Task) -> None:
+        """Register a task appended to the end of the task list"""
+        self._by_id[task.id] = task
+        if task.group not in self._by_group:
+            self._sorted_groups_cache = None
+        self._by_group.setdefault(task.group, []).append(task)
+        self._by_status.setdefault(task.status, []).append(task)
+
+    def _unindex_task(self, task: Task) -> None:
+        """Drop a task from every lookup table"""
+        self._by_id.pop(task.id, None)
+        self._bucket_remove(self._by_group, task.group, task)
+        self._bucket_remove(self._by_status, task.status, task)
+        if task.group not in self._by_group:
+            self._sorted_groups_cache = None
+
+    @staticmethod
+    def _bucket_remove(index: Dict[str, List[Task]], key: str, task: Task) -> None:
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.remove(task)
+        if not bucket:
+            del index[key]
 
     def save_tasks(self) -> None:
-        """Save tasks with backup"""
-        FileManager.save_json(Config.PATHS["TASKS"], self.tasks, create_backup=True)
+        """Write the tasks changed since the last save"""
+        if not self._pending:
+            return
+        try:
+            self._require_store()
+            upserts = [t for t in self._pending.values() if t is not None]
+            deletes = [i for i, t in self._pending.items() if t is None]
+            self.store.write(upserts, deletes)
+            self._pending.clear()
+            logger.info(f"Saved {len(upserts)} and deleted {len(deletes)} tasks")
+        except Exception as e:
+            ErrorHandler.handle_error(e, "Error saving tasks")
+
+    def _require_store(self) -> None:
+        """Refuse a change that could never be written"""
+        if self.store is None:
+            raise RuntimeError(Config.UI_STRINGS["ERROR_NO_STORE"])
+
+    def _request_save(self, task_id: str) -> None:
+        """Record a changed task and coalesce bursts of changes into one save"""
+        self._pending[task_id] = self._by_id.get(task_id)
+        if self.root is None:
+            self.save_tasks()
+            return
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(Config.SAVE_DEBOUNCE_MS,
+                                              self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        self._save_after_id = None
+        self.save_tasks()
+
+    def flush(self) -> None:
+        """Write any pending changes immediately"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self.save_tasks()
 
     def add_task(self, task_data: Dict) -> bool:
         """Add a new task with validation"""
         try:
-            task = {
-                "id": str(uuid4()),
+            self._require_store()
+            task = Task.from_dict({
+                "id": uuid4().hex,
                 "created_at": datetime.now().isoformat(),
                 "status": "pending",
                 **task_data
-            }
+            })
+            if task.depends_on == task.id:
+                raise ValueError(Config.UI_STRINGS["ERROR_DEPENDENCY_SELF"])
+            if self.would_create_cycle(task.id, task.depends_on):
+                raise ValueError(Config.UI_STRINGS["ERROR_DEPENDENCY_CYCLE"])
             self.tasks.append(task)
-            self.save_tasks()
-            logger.info(f"Task added: {task['task']}")
+            self._index_task(task)
+            self._request_save(task.id)
+            logger.info(f"Task added: {task.task}")
             return True
         except Exception as e:
             ErrorHandler.handle_error(e, "Error adding task")
@@ -155,8 +459,12 @@ class TaskManager:
     def delete_task(self, task_id: str) -> bool:
         """Delete a task by ID"""
         try:
-            self.tasks = [t for t in self.tasks if t["id"] != task_id]
-            self.save_tasks()
+            self._require_store()
+            task = self._by_id.get(task_id)
+            if task is not None:
+                self._unindex_task(task)
+                self.tasks = [t for t in self.tasks if t.id != task_id]
+                self._request_save(task_id)
             logger.info(f"Task deleted: {task_id}")
             return True
         except Exception as e:
@@ -170,44 +478,120 @@ class TaskManager:
             if not task:
                 return None
 
-            if task.get("depends_on"):
-                dep = self.find_task_by_id(task["depends_on"])
-                if dep and dep["status"] != "done":
-                    return False
+            if self.find_unmet_dependency(task_id):
+                return False
 
-            task["status"] = "done" if task["status"] == "pending" else "pending"
-            self.save_tasks()
-            logger.info(f"Task status toggled: {task['task']}")
+            self._require_store()
+
+            # Appended out of display order; the re-sort that follows every
+            # change (see TaskTickerUI.update_ui) puts it back in place
+            self._bucket_remove(self._by_status, task.status, task)
+            task.status = "done" if task.status == "pending" else "pending"
+            self._by_status.setdefault(task.status, []).append(task)
+            self._request_save(task_id)
+            logger.info(f"Task status toggled: {task.task}")
             return True
         except Exception as e:
             ErrorHandler.handle_error(e, "Error toggling task status")
             return None
 
-    def find_task_by_id(self, task_id: str) -> Optional[Dict]:
+    def find_task_by_id(self, task_id: str) -> Optional[Task]:
         """Find a task by ID"""
-        return next((t for t in self.tasks if t["id"] == task_id), None)
+        return self._by_id.get(task_id)
+
+    def _ancestors(self, task_id: str):
+        """Yield the dependency chain above a task, stopping at any cycle"""
+        seen = {task_id}
+        task = self._by_id.get(task_id)
+        while task is not None and task.depends_on not in seen:
+            task = self._by_id.get(task.depends_on)
+            if task is None:
+                return
+            seen.add(task.id)
+            yield task
 
-    def get_filtered_tasks(self, status: str, group: str) -> List[Dict]:
+    def would_create_cycle(self, task_id: str, parent_id: Optional[str]) -> bool:
+        """Check whether making task_id depend on parent_id closes a loop"""
+        if not parent_id:
+            return False
+        if parent_id == task_id:
+            return True
+        return any(t.id == task_id for t in self._ancestors(parent_id))
+
+    def find_unmet_dependency(self, task_id: str) -> Optional[Task]:
+        """Find the nearest task up the dependency chain that is not done"""
+        return next((t for t in self._ancestors(task_id) if t.status != "done"), None)
+
+    def compute_blocked(self) -> Set[str]:
+        """Get the IDs of all tasks with an unfinished task anywhere above them"""
+        unmet: Dict[str, bool] = {}
+        for task in self.tasks:
+            # Climb until reaching a root, a resolved task, or a cycle
+            path: List[Task] = []
+            on_path: Set[str] = set()
+            current = task
+            while current.id not in unmet and current.id not in on_path:
+                path.append(current)
+                on_path.add(current.id)
+                parent = self._by_id.get(current.depends_on)
+                if parent is None:
+                    break
+                current = parent
+
+            # Resolve back down the chain so each task is visited only once
+            for node in reversed(path):
+                parent = self._by_id.get(node.depends_on)
+                if parent is None:
+                    unmet[node.id] = False
+                else:
+                    unmet[node.id] = (parent.status != "done"
+                                    or unmet.get(parent.id, False))
+        return {task_id for task_id, blocked in unmet.items() if blocked}
+
+    def get_filtered_tasks(self, status: str, group: str) -> List[Task]:
         """Get filtered tasks based on status and group"""
-        filtered = self.tasks
-        if status != "All":
-            filtered = [t for t in filtered if t["status"].lower() == status.lower()]
-        if group != "All Groups":
-            filtered = [t for t in filtered if t["group"] == group]
-        return filtered
+        # Statuses are stored lowercase (see Task.from_dict), so the filter is
+        # lowered once here and every task compares without string work
+        status = status.lower()
+        by_status = self.tasks if status == "all" else self._by_status.get(status, [])
+        if group == "All Groups":
+            return list(by_status)
+
+        by_group = self._by_group.get(group, [])
+        if status == "all":
+            return list(by_group)
+
+        # Scan whichever bucket is smaller and check the other attribute
+        if len(by_group) < len(by_status):
+            return [t for t in by_group if t.status == status]
+        return [t for t in by_status if t.group == group]
+
+    def get_groups(self) -> Tuple[str, ...]:
+        """Get the sorted names of all groups that currently have tasks"""
+        if self._sorted_groups_cache is None:
+            self._sorted_groups_cache = tuple(sorted(self._by_group))
+        return self._sorted_groups_cache
 
     def sort_tasks(self, key: str) -> None:
         """Sort tasks by the specified key"""
-        self.tasks.sort(key=lambda t: t.get(key) or ("9999-12-31" if key == "due_date" else 9999))
+        # Missing values sort last; pick the placeholder once rather than per task
+        sentinel = "9999-12-31" if key == "due_date" else 9999
+        self.tasks.sort(key=lambda t: getattr(t, key, None) or sentinel)
+        # Reordering never changes the set of groups, so keep their cache
+        groups = self._sorted_groups_cache
+        self._rebuild_index()
+        self._sorted_groups_cache = groups
 
 # ---------------------------
 # UI COMPONENTS
 # ---------------------------
 class TaskTickerUI:
     """Handles UI creation and updates"""
-    def __init__(self, root: tk.Tk, task_manager: TaskManager):
+    def __init__(self, root: tk.Tk, task_manager: TaskManager,
+                 settings: Optional[Dict] = None):
         self.root = root
         self.task_manager = task_manager
+        self.settings = settings or Config.DEFAULT_SETTINGS
         self.setup_window()
         self.create_variables()
         self.create_widgets()
@@ -215,25 +599,34 @@ class TaskTickerUI:
     def setup_window(self) -> None:
         """Initialize window properties"""
         self.root.title(Config.UI_STRINGS["WINDOW_TITLE"])
-        self.root.geometry(Config.DEFAULT_SETTINGS["window_size"])
+        try:
+            self.root.geometry(self.settings["window_size"])
+        except tk.TclError as e:
+            logger.warning(f"Ignoring window_size setting: {e}")
+            self.root.geometry(Config.DEFAULT_SETTINGS["window_size"])
         self.root.resizable(False, False)
 
     def create_variables(self) -> None:
         """Initialize Tkinter variables"""
         self.filter_mode = tk.StringVar(value="All")
         self.group_filter = tk.StringVar(value="All Groups")
-        self.group_entry_var = tk.StringVar(value=Config.DEFAULT_SETTINGS["default_group"])
-        self.sort_key = tk.StringVar(value=Config.DEFAULT_SETTINGS["default_sort"])
+        self.group_entry_var = tk.StringVar(value=self.settings["default_group"])
+        self.sort_key = tk.StringVar(value=self.settings["default_sort"])
         self.selected_dependency = tk.StringVar(value="None")
         self.sequence_input = tk.StringVar(value="1")
 
     def create_widgets(self) -> None:
         """Create all UI widgets"""
+        self.dep_dropdown = None
+        self._last_groups: Optional[tuple] = None
+        self._last_dep_entries: Optional[tuple] = None
         self.create_control_frame()
         self.create_entry_frame()
-        self.create_dependency_frame()
         self.create_list_frame()
         self.create_button_frame()
+        # The dependency picker is not needed for first paint; build it once
+        # the window has been drawn
+        self.root.after_idle(self.create_dependency_frame)
 
     def create_control_frame(self) -> None:
         """Create the control panel frame"""
@@ -253,11 +646,11 @@ class TaskTickerUI:
                                           "All Groups", 
                                           command=self.on_filter_change)
         self.group_dropdown.grid(row=0, column=3)
+        self._group_pick_cmd = self.root.register(self.on_filter_change)
 
         # Sort controls
         tk.Label(control_frame, text="Sort by:").grid(row=1, column=0, padx=5)
-        sort_menu = tk.OptionMenu(control_frame, self.sort_key,
-                                "due_date", "created_at", "priority", "sequence",
+        sort_menu = tk.OptionMenu(control_frame, self.sort_key, *Config.SORT_KEYS,
                                 command=self.on_sort_change)
         sort_menu.grid(row=1, column=1)
 
@@ -267,6 +660,9 @@ class TaskTickerUI:
 
     def create_entry_frame(self) -> None:
         """Create the task entry frame"""
+        # Imported here because tkcalendar pulls in babel and its locale data
+        from tkcalendar import DateEntry
+
         entry_frame = tk.Frame(self.root)
         entry_frame.pack(pady=10)
 
@@ -296,25 +692,47 @@ class TaskTickerUI:
     def create_dependency_frame(self) -> None:
         """Create the dependency selection frame"""
         dep_frame = tk.Frame(self.root)
-        dep_frame.pack()
+        dep_frame.pack(before=self.list_frame)
 
         tk.Label(dep_frame, text="Depends On:").pack(side=tk.LEFT)
         self.dep_dropdown = tk.OptionMenu(dep_frame, self.selected_dependency, "None")
         self.dep_dropdown.pack(side=tk.LEFT)
+        self.update_dependency_dropdown()
 
     def create_list_frame(self) -> None:
         """Create the task list frame"""
         list_frame = tk.Frame(self.root)
         list_frame.pack(pady=10)
+        self.list_frame = list_frame
 
-        self.task_listbox = tk.Listbox(list_frame, height=18, width=80)
-        self.task_listbox.pack(side=tk.LEFT)
+        # The tree only ever holds the rows in view; scrolling is driven by
+        # _scroll_to, which swaps in the next slice of visible_tasks
+        self._top = 0
+        self._selected_index: Optional[int] = None
+        self._blocked_ids: Set[str] = set()
+        self.task_tree = ttk.Treeview(list_frame, columns=Config.LIST_COLUMNS,
+                                      show="headings", height=Config.LIST_ROWS,
+                                      selectmode="browse")
+        for column, heading, width in zip(Config.LIST_COLUMNS,
+                                          Config.LIST_HEADINGS,
+                                          Config.LIST_WIDTHS):
+            self.task_tree.heading(column, text=heading)
+            self.task_tree.column(column, width=width,
+                                  stretch=(column == "task"))
+        self.task_tree.pack(side=tk.LEFT)
 
-        scrollbar = tk.Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar = tk.Scrollbar(list_frame, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.task_listbox.config(yscrollcommand=scrollbar.set)
-        scrollbar.config(command=self.task_listbox.yview)
+        self.task_tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.task_tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.task_tree.bind("<Button-4>", lambda e: self.scroll_by(-1))
+        self.task_tree.bind("<Button-5>", lambda e: self.scroll_by(1))
+        self.task_tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.task_tree.bind("<Down>", lambda e: self.move_selection(1))
+        # The tree only holds one page, so its own paging has nothing to scroll
+        self.task_tree.bind("<Prior>", lambda e: self.move_selection(-Config.LIST_ROWS))
+        self.task_tree.bind("<Next>", lambda e: self.move_selection(Config.LIST_ROWS))
 
     def create_button_frame(self) -> None:
         """Create the action buttons frame"""
@@ -331,41 +749,121 @@ class TaskTickerUI:
 
     def update_group_filter_options(self) -> None:
         """Update group filter dropdown options"""
-        groups = sorted({t["group"] for t in self.task_manager.tasks})
+        groups = self.task_manager.get_groups()
+        if groups == self._last_groups:
+            return
+        self._last_groups = groups
+
         menu = self.group_dropdown["menu"]
         menu.delete(0, "end")
-        menu.add_command(label="All Groups",
-                        command=lambda: self.set_group_filter("All Groups"))
-        for g in groups:
-            menu.add_command(label=g,
-                           command=lambda val=g: self.set_group_filter(val))
+        # Entries write straight into the Tk variable and share one
+        # registered callback instead of a closure per item
+        for g in ("All Groups", *groups):
+            menu.add_radiobutton(label=g, value=g, variable=self.group_filter,
+                                 command=self._group_pick_cmd)
 
     def update_dependency_dropdown(self) -> None:
         """Update dependency selection dropdown"""
-        self.task_manager.dependency_map.clear()
+        if self.dep_dropdown is None:  # not built yet, see create_widgets
+            return
+        entries = tuple(
+            (f"{task.task} [{task.group}] (ID: {task.id[:6]}...)", task.id)
+            for task in self.task_manager.tasks
+        )
+        # Toggling status leaves the labels untouched, so skip the Tcl work
+        if entries == self._last_dep_entries:
+            return
+        self._last_dep_entries = entries
+
+        dependency_map = self.task_manager.dependency_map
+        dependency_map.clear()
         menu = self.dep_dropdown["menu"]
         menu.delete(0, "end")
-        menu.add_command(label="None",
-                        command=lambda: self.selected_dependency.set("None"))
-        for task in self.task_manager.tasks:
-            label = f"{task['task']} [{task['group']}] (ID: {task['id'][:6]}...)"
-            self.task_manager.dependency_map[label] = task["id"]
-            menu.add_command(label=label,
-                           command=lambda val=label: self.selected_dependency.set(val))
+        menu.add_radiobutton(label="None", value="None",
+                             variable=self.selected_dependency)
+        for label, task_id in entries:
+            dependency_map[label] = task_id
+            menu.add_radiobutton(label=label, value=label,
+                                 variable=self.selected_dependency)
 
     def render_task_list(self) -> None:
         """Render the filtered task list"""
-        self.task_listbox.delete(0, tk.END)
-        self.task_manager.visible_tasks = self.task_manager.get_filtered_tasks(
+        visible = self.task_manager.get_filtered_tasks(
             self.filter_mode.get(),
             self.group_filter.get()
         )
-        for t in self.task_manager.visible_tasks:
-            blocked = " ⛔" if t.get("depends_on") and \
-                     self.task_manager.find_task_by_id(t["depends_on"])["status"] != "done" else ""
-            seq = f"[{t.get('sequence', '?')}]"
-            line = f"{seq} {'✔' if t['status']=='done' else ''} {t['task']} [{t['group']}] (Due: {t['due_date']}){blocked}"
-            self.task_listbox.insert(tk.END, line)
+        self.task_manager.visible_tasks = visible
+        self._selected_index = None
+
+        # Resolve blocked state for the whole dependency graph in one pass;
+        # rows themselves are only formatted when they scroll into view
+        self._blocked_ids = self.task_manager.compute_blocked()
+        self._scroll_to(self._top, force=True)
+
+    def _row_values(self, task: Task) -> tuple:
+        marks = Config.UI_STRINGS["GLYPH_DONE"] if task.status == "done" else ""
+        if task.id in self._blocked_ids:
+            marks += Config.UI_STRINGS["GLYPH_BLOCKED"]
+        sequence = "?" if task.sequence is None else task.sequence
+        return (sequence, marks.strip(), task.task, task.group, task.due_date)
+
+    def _scroll_to(self, top: int, force: bool = False) -> None:
+        """Show the slice of visible tasks starting at index top"""
+        visible = self.task_manager.visible_tasks
+        top = max(0, min(top, len(visible) - Config.LIST_ROWS))
+        if top == self._top and not force:
+            return
+        self._top = top
+        end = min(top + Config.LIST_ROWS, len(visible))
+
+        tree = self.task_tree
+        tree.delete(*tree.get_children())
+        for index in range(top, end):
+            tree.insert("", tk.END, iid=str(index),
+                        values=self._row_values(visible[index]))
+        if self._selected_index is not None and top <= self._selected_index < end:
+            tree.selection_set(str(self._selected_index))
+            tree.focus(str(self._selected_index))
+
+        if visible:
+            self.scrollbar.set(top / len(visible), end / len(visible))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_by(self, rows: int) -> str:
+        """Scroll the task list by a number of rows"""
+        self._scroll_to(self._top + rows)
+        return "break"
+
+    def move_selection(self, step: int) -> str:
+        """Move the selection, scrolling when it leaves the viewport"""
+        visible = self.task_manager.visible_tasks
+        if not visible:
+            return "break"
+        if self._selected_index is None:
+            # Nothing selected yet: start from the edge of the view
+            # in the direction of travel
+            if step > 0:
+                self._selected_index = self._top
+            else:
+                self._selected_index = min(self._top + Config.LIST_ROWS, len(visible)) - 1
+        else:
+            self._selected_index = max(0, min(self._selected_index + step,
+                                              len(visible) - 1))
+        if self._selected_index < self._top:
+            self._scroll_to(self._selected_index, force=True)
+        elif self._selected_index >= self._top + Config.LIST_ROWS:
+            self._scroll_to(self._selected_index - Config.LIST_ROWS + 1, force=True)
+        else:
+            self.task_tree.selection_set(str(self._selected_index))
+            self.task_tree.focus(str(self._selected_index))
+        return "break"
+
+    def selected_task(self) -> Task:
+        """Get the selected task, raising IndexError if there is none"""
+        if self._selected_index is None:
+            raise IndexError("no task selected")
+        return self.task_manager.visible_tasks[self._selected_index]
 
     # Event Handlers
     def on_add_task(self) -> None:
@@ -385,7 +883,7 @@ class TaskTickerUI:
 
         if depends_on:
             parent = self.task_manager.find_task_by_id(depends_on)
-            if parent and parent['due_date'] > due_date:
+            if parent and parent.due_date > due_date:
                 messagebox.showwarning("Due Date Conflict",
                                      Config.UI_STRINGS["ERROR_DUE_DATE"])
                 return
@@ -409,9 +907,8 @@ class TaskTickerUI:
     def on_delete_task(self) -> None:
         """Handle delete task button click"""
         try:
-            idx = self.task_listbox.curselection()[0]
-            task = self.task_manager.visible_tasks[idx]
-            if self.task_manager.delete_task(task["id"]):
+            task = self.selected_task()
+            if self.task_manager.delete_task(task.id):
                 self.update_ui()
         except IndexError:
             messagebox.showerror("No Selection",
@@ -420,15 +917,14 @@ class TaskTickerUI:
     def on_toggle_status(self) -> None:
         """Handle toggle status button click"""
         try:
-            idx = self.task_listbox.curselection()[0]
-            task = self.task_manager.visible_tasks[idx]
-            result = self.task_manager.toggle_task_status(task["id"])
+            task = self.selected_task()
+            result = self.task_manager.toggle_task_status(task.id)
             
             if result is False:  # Dependency not met
-                dep = self.task_manager.find_task_by_id(task["depends_on"])
+                dep = self.task_manager.find_unmet_dependency(task.id)
                 messagebox.showwarning(
                     "Dependency Unmet",
-                    Config.UI_STRINGS["ERROR_DEPENDENCY_UNMET"].format(dep['task'])
+                    Config.UI_STRINGS["ERROR_DEPENDENCY_UNMET"].format(dep.task)
                 )
             elif result is True:  # Successfully toggled
                 self.update_ui()
@@ -436,6 +932,25 @@ class TaskTickerUI:
             messagebox.showerror("No Selection",
                                Config.UI_STRINGS["ERROR_NO_SELECTION"])
 
+    def on_tree_select(self, event) -> None:
+        """Track the selection by task index so it survives scrolling"""
+        selection = self.task_tree.selection()
+        # Repainting a slice clears the selection; keep the tracked index
+        if selection:
+            self._selected_index = int(selection[0])
+
+    def on_scrollbar(self, action: str, amount: str, unit: str = "units") -> None:
+        """Handle scrollbar drags and arrow clicks"""
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self.task_manager.visible_tasks)))
+        elif action == "scroll":
+            step = Config.LIST_ROWS if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+    def on_mouse_wheel(self, event) -> str:
+        """Handle mouse wheel scrolling on Windows and macOS"""
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
     def on_filter_change(self, *args) -> None:
         """Handle filter change"""
         self.render_task_list()
@@ -443,12 +958,14 @@ class TaskTickerUI:
     def on_sort_change(self, *args) -> None:
         """Handle sort change"""
         self.task_manager.sort_tasks(self.sort_key.get())
+        # The dependency menu lists tasks in sorted order, so refresh it after
+        # sorting; its cache then only misses when the order really changed
+        self.update_dependency_dropdown()
         self.render_task_list()
 
     def update_ui(self) -> None:
         """Update all UI elements"""
         self.update_group_filter_options()
-        self.update_dependency_dropdown()
         self.on_sort_change()
 
 # ---------------------------
@@ -457,24 +974,59 @@ class TaskTickerUI:
 class TaskTickerApp:
     """Main application class"""
     def __init__(self):
-        self.root = tk.Tk()
         self.task_manager = TaskManager()
         self.ui = None
-        self.initialize_app()
+        # Start the independent file reads first so they overlap Tk startup
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            self._tasks_future = pool.submit(self.task_manager.read_tasks)
+            self._settings_future = pool.submit(FileManager.read_json,
+                                                Config.PATHS["SETTINGS"], {})
+            self.root = tk.Tk()
+            self.task_manager.root = self.root
+            self.initialize_app()
+
+    def load_settings(self) -> Dict:
+        """Merge saved settings over the defaults, skipping values that do not fit"""
+        path = Config.PATHS["SETTINGS"]
+        try:
+            saved = self._settings_future.result() or {}
+            if not isinstance(saved, dict):
+                raise ValueError("expected a JSON object")
+        except Exception as e:
+            ErrorHandler.handle_error(e, f"Error loading {path}")
+            saved = {}
+
+        settings = dict(Config.DEFAULT_SETTINGS)
+        for key, default in Config.DEFAULT_SETTINGS.items():
+            if key not in saved:
+                continue
+            value = saved[key]
+            if type(value) is not type(default) or (
+                    key == "default_sort" and value not in Config.SORT_KEYS):
+                logger.warning(f"Ignoring invalid {key} in {path}: {value!r}")
+                continue
+            settings[key] = value
+        return settings
 
     def initialize_app(self) -> None:
         """Initialize the application with proper error handling"""
         try:
             logger.info("Initializing Task Ticker application")
-            self.task_manager.load_tasks()
-            self.ui = TaskTickerUI(self.root, self.task_manager)
+            self.ui = TaskTickerUI(self.root, self.task_manager, self.load_settings())
+            self.task_manager.load_tasks(self._tasks_future)
             self.ui.update_ui()
+            self.root.protocol("WM_DELETE_WINDOW", self.on_close)
             logger.info("Application initialized successfully")
         except Exception as e:
             ErrorHandler.handle_error(e, "Error initializing application")
             self.root.destroy()
             return
 
+    def on_close(self) -> None:
+        """Persist pending changes before the window goes away"""
+        self.task_manager.flush()
+        self.root.destroy()
+
     def run(self) -> None:
         """Start the application"""
         try:
@@ -482,7 +1034,9 @@ class TaskTickerApp:
         except Exception as e:
             ErrorHandler.handle_error(e, "Error in main loop")
         finally:
+            self.task_manager.close()
             logger.info("Application closed")
+            LoggerSetup.shutdown()
             logging.shutdown()
 
 if __name__ == "__main__":